@@ -3,6 +3,7 @@ import curses.textpad
 import sqlite3
 import datetime
 import argparse
+import functools
 
 DB_FILENAME = 'ideas.db'
 
@@ -10,9 +11,20 @@ def init_db():
     """
     Initialize the database and create the ideas table with 'pos', 'created_date',
     'notes', and 'archived' columns.
+
+    The connection is opened in autocommit mode (isolation_level=None) and
+    the write helpers manage their own BEGIN/COMMIT, so the DB-API never
+    wraps statements in implicit transactions behind our back.
     """
-    conn = sqlite3.connect(DB_FILENAME)
+    conn = sqlite3.connect(DB_FILENAME, isolation_level=None)
     cur = conn.cursor()
+    # WAL with relaxed syncing needs only one fsync per commit instead of
+    # two, and the in-memory temp store / larger page cache keep sorts and
+    # index maintenance off the disk.
+    cur.execute('PRAGMA journal_mode=WAL')
+    cur.execute('PRAGMA synchronous=NORMAL')
+    cur.execute('PRAGMA temp_store=MEMORY')
+    cur.execute('PRAGMA cache_size=-8000')
     cur.execute('''
         CREATE TABLE IF NOT EXISTS ideas (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -23,16 +35,19 @@ def init_db():
             archived INTEGER NOT NULL DEFAULT 0
         )
     ''')
-    conn.commit()
+    # Indexes matching get_ideas' two orderings, so ORDER BY walks the
+    # index instead of sorting every row on each fetch.
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_ideas_pos ON ideas(pos)')
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_ideas_created ON ideas(created_date, id)')
     return conn
 
-def add_idea(conn, title, notes):
+def add_idea(cur, title, notes):
     """
     Insert a new idea into the database.
     The new idea is appended at the end (largest 'pos' value) and marked as not archived.
     The created_date is automatically set to today's date.
     """
-    cur = conn.cursor()
+    cur.execute('BEGIN')
     cur.execute('SELECT MAX(pos) FROM ideas')
     max_pos = cur.fetchone()[0]
     new_pos = 0 if max_pos is None else max_pos + 1
@@ -41,86 +56,122 @@ def add_idea(conn, title, notes):
         INSERT INTO ideas (title, pos, created_date, notes, archived)
         VALUES (?, ?, ?, ?, 0)
     ''', (title, new_pos, created_date, notes))
-    conn.commit()
+    cur.connection.commit()
 
-def delete_idea(conn, idea_id):
+def delete_idea(cur, idea_id):
     """
     Delete an idea by its ID.
     """
-    cur = conn.cursor()
+    cur.execute('BEGIN')
     cur.execute('DELETE FROM ideas WHERE id = ?', (idea_id,))
-    conn.commit()
+    cur.connection.commit()
+
+# One interned SQL string per ordering; reusing the identical string lets
+# sqlite3's statement cache hand back the already-prepared plan.
+_LIST_VIEW_QUERIES = {
+    'pos': 'SELECT id, title, pos, created_date, substr(notes, 1, 53), archived FROM ideas ORDER BY pos',
+    'created_date': 'SELECT id, title, pos, created_date, substr(notes, 1, 53), archived FROM ideas ORDER BY created_date',
+}
 
-def get_ideas(conn, order_by='pos'):
+def get_ideas_list_view(cur, order_by='pos'):
     """
-    Retrieve all ideas from the database.
+    Retrieve all ideas for the list view.
     When order_by is 'pos' they are sorted by the pos column;
     when 'created_date', sorted by the created_date column.
-    Returns a list of tuples: (id, title, pos, created_date, notes, archived).
+    Notes are trimmed to a 53-character preview in SQL (enough for the
+    50-character display truncation plus the "..." check) so large notes
+    bodies never cross the sqlite3 boundary just to draw the list.
+    Returns a list of tuples: (id, title, pos, created_date, notes_preview, archived).
     """
-    cur = conn.cursor()
-    if order_by == 'pos':
-        cur.execute('SELECT id, title, pos, created_date, notes, archived FROM ideas ORDER BY pos')
-    elif order_by == 'created_date':
-        cur.execute('SELECT id, title, pos, created_date, notes, archived FROM ideas ORDER BY created_date')
-    else:
-        cur.execute('SELECT id, title, pos, created_date, notes, archived FROM ideas ORDER BY pos')
+    cur.execute(_LIST_VIEW_QUERIES.get(order_by, _LIST_VIEW_QUERIES['pos']))
     return cur.fetchall()
 
-def update_idea_order(conn, ideas_order):
+def get_idea_full(cur, idea_id):
     """
-    Given a list of ideas in the new order, update the 'pos' values in the database.
+    Retrieve a single idea with its complete notes, for the edit dialog.
     """
-    cur = conn.cursor()
-    for new_pos, idea in enumerate(ideas_order):
-        idea_id = idea[0]
-        cur.execute('UPDATE ideas SET pos = ? WHERE id = ?', (new_pos, idea_id))
-    conn.commit()
+    cur.execute('SELECT id, title, pos, created_date, notes, archived FROM ideas WHERE id = ?',
+                (idea_id,))
+    return cur.fetchone()
+
+_UPDATE_POS_QUERY = 'UPDATE ideas SET pos = ? WHERE id = ?'
 
-def toggle_idea_archived(conn, idea_id, current_archived):
+def update_idea_order(cur, ideas_order):
+    """
+    Given a list of ideas in the new order, update the 'pos' values in the database.
+    Only the rows whose position actually changed are written, inside a single
+    transaction, so a simple swap of two neighbours updates two rows rather
+    than every idea in the list.
+    """
+    cur.execute('SELECT id, pos FROM ideas')
+    current_pos = dict(cur.fetchall())
+    params = [(new_pos, idea[0]) for new_pos, idea in enumerate(ideas_order)
+              if current_pos.get(idea[0]) != new_pos]
+    if not params:
+        return
+    cur.execute('BEGIN')
+    cur.executemany(_UPDATE_POS_QUERY, params)
+    cur.connection.commit()
+
+def toggle_idea_archived(cur, idea_id):
     """
     Toggle the 'archived' status of an idea.
+    The flip happens in SQL, so the caller never has to carry (possibly
+    stale) archived state.
     """
-    new_archived = 0 if current_archived else 1
-    cur = conn.cursor()
-    cur.execute('UPDATE ideas SET archived = ? WHERE id = ?', (new_archived, idea_id))
-    conn.commit()
+    cur.execute('BEGIN')
+    cur.execute('UPDATE ideas SET archived = 1 - archived WHERE id = ?', (idea_id,))
+    cur.connection.commit()
 
-def update_idea_info(conn, idea_id, title, notes):
+def update_idea_info(cur, idea_id, title, notes):
     """
     Update the title and notes of an idea.
     """
-    cur = conn.cursor()
+    cur.execute('BEGIN')
     cur.execute('''
         UPDATE ideas
         SET title = ?, notes = ?
         WHERE id = ?
     ''', (title, notes, idea_id))
-    conn.commit()
+    cur.connection.commit()
 
 def get_line_with_esc(win, y, x, max_length):
     """
     Read a single line of input from win at (y,x) with a maximum length.
     If the user presses ESC (key code 27), return None to signal cancellation.
+
+    After each blocking read, any further characters already queued (e.g.
+    from a paste) are drained in one batch and the line is repainted once,
+    instead of one curses round-trip per character.
     """
-    s = ""
+    buf = []
     while True:
-        ch = win.getch(y, x + len(s))
-        if ch == 27:  # ESC key
-            return None
-        elif ch in (curses.KEY_ENTER, ord('\n')):
-            break
-        elif ch in (curses.KEY_BACKSPACE, 127, 8):
-            if len(s) > 0:
-                s = s[:-1]
-                win.move(y, x)
-                win.clrtoeol()
-                win.addstr(y, x, s)
-        else:
-            if len(s) < max_length:
-                s += chr(ch)
-                win.addch(y, x + len(s) - 1, ch)
-    return s
+        batch = [win.getch(y, x + len(buf))]
+        win.nodelay(True)
+        while (ch := win.getch()) != -1:
+            batch.append(ch)
+        win.nodelay(False)
+
+        for i, ch in enumerate(batch):
+            if ch == 27:  # ESC key
+                return None
+            elif ch in (curses.KEY_ENTER, ord('\n')):
+                # Re-queue anything drained after the newline so it stays
+                # available to the next input field (e.g. the notes box when
+                # multi-line text is pasted at the title prompt), just as it
+                # would have without the batch drain.
+                for tail_ch in reversed(batch[i + 1:]):
+                    curses.ungetch(tail_ch)
+                return ''.join(buf)
+            elif ch in (curses.KEY_BACKSPACE, 127, 8):
+                del buf[-1:]
+            else:
+                if len(buf) < max_length:
+                    buf.append(chr(ch))
+
+        win.move(y, x)
+        win.clrtoeol()
+        win.addstr(y, x, ''.join(buf))
 
 def notes_validator(ch):
     """
@@ -165,10 +216,10 @@ def dialog_template_idea(stdscr, init_title, init_notes, dialog_title):
     edit_win.clear()
     if init_notes:
         h, w_inner = edit_win.getmaxyx()
-        lines = init_notes.splitlines()
-        for i, line in enumerate(lines):
-            if i >= h:
-                break
+        # split('\n', h) stops splitting after the visible line count, so a
+        # large notes body never gets materialized as a full list of lines;
+        # zip with range(h) drops the unsplit remainder.
+        for i, line in zip(range(h), init_notes.split('\n', h)):
             try:
                 edit_win.addnstr(i, 0, line, w_inner - 1)
             except curses.error:
@@ -207,6 +258,71 @@ def dialog_template_idea(stdscr, init_title, init_notes, dialog_title):
             curses.curs_set(0)
             return None
 
+@functools.lru_cache(maxsize=4)
+def separator_line(max_x):
+    """
+    The row-separator string, cached per terminal width so it is built
+    once per resize instead of once per visible row per frame.
+    """
+    return "-" * (max_x - 1)
+
+@functools.lru_cache(maxsize=1024)
+def format_idea_row(idx, title, notes, created_date, archived):
+    """
+    Build the display strings for one idea row. Pure function of its
+    arguments, so repeated frames hit the cache instead of re-slicing
+    and re-formatting the same idea on every keystroke.
+    """
+    # Truncate idea notes to the first 50 characters (append "..." if longer)
+    truncated_notes = (notes[:50] + '...') if len(notes) > 50 else notes
+    text_part = f"{idx + 1}. {title}"
+    notes_part = f" | {truncated_notes}"
+    date_part = f" | {created_date}"
+    status = " | Archived" if archived else ""
+    return text_part, notes_part, date_part, status
+
+def draw_idea_row(stdscr, idea, idx, row, max_x, selected, moving):
+    """
+    Draw a single idea (its text line plus the separator line below it)
+    at the given screen row. 'selected' and 'moving' control the highlight.
+    """
+    idea_id, title, pos, created_date, notes, archived = idea
+    text_part, notes_part, date_part, status = format_idea_row(
+        idx, title, notes, created_date, archived)
+
+    if archived:
+        idea_text_color = curses.color_pair(6)
+    else:
+        idea_text_color = curses.color_pair(4) | curses.A_BOLD
+
+    # When the idea is selected or being moved, highlight the title,
+    # but draw the date with normal attributes.
+    if moving:
+        text_style = idea_text_color | curses.A_UNDERLINE
+        date_style = curses.A_NORMAL
+    elif selected:
+        text_style = idea_text_color | curses.A_REVERSE
+        date_style = curses.A_NORMAL
+    else:
+        text_style = idea_text_color
+        date_style = curses.color_pair(5)
+
+    try:
+        # Write the whole row in one call, then apply the styled spans with
+        # chgat; curses turns the contiguous text into a single run instead
+        # of four separate addstr entries.
+        stdscr.addnstr(row, 0, text_part + notes_part + date_part + status, max_x - 1)
+        text_len = len(text_part)
+        date_off = text_len + len(notes_part)
+        stdscr.chgat(row, 0, text_len, text_style)
+        stdscr.chgat(row, date_off, len(date_part), date_style)
+        if status:
+            stdscr.chgat(row, date_off + len(date_part), len(status),
+                         curses.color_pair(1) | curses.A_BOLD)
+        stdscr.addstr(row + 1, 0, separator_line(max_x))
+    except curses.error:
+        pass
+
 def new_idea_dialog(stdscr):
     return dialog_template_idea(stdscr, "", "", "New Idea")
 
@@ -215,6 +331,9 @@ def edit_idea_dialog(stdscr, init_title, init_notes):
 
 def main(stdscr):
     conn = init_db()
+    # One cursor for the whole session; sqlite3 reuses its prepared
+    # statements and we skip a cursor allocation per helper call.
+    cur = conn.cursor()
     curses.curs_set(0)  # hide the cursor
 
     # Enable color support and define our color pairs.
@@ -228,6 +347,19 @@ def main(stdscr):
     else:
         curses.init_pair(6, curses.COLOR_WHITE, curses.COLOR_BLACK)
 
+    # Cache of the last-fetched idea list per ordering; cleared whenever a
+    # mutation touches the database, so pure navigation costs no SQL at all.
+    idea_cache = {'pos': None, 'created_date': None}
+
+    def fetch_ideas(order):
+        if idea_cache[order] is None:
+            idea_cache[order] = get_ideas_list_view(cur, order)
+        return idea_cache[order]
+
+    def invalidate_ideas():
+        idea_cache['pos'] = None
+        idea_cache['created_date'] = None
+
     # current_order is either 'pos' (manual order) or 'created_date'
     current_order = 'pos'
     current_selection = 0  # index of highlighted idea
@@ -235,21 +367,29 @@ def main(stdscr):
     reorder_list = None
     scroll_offset = 0
 
+    # What was on screen last frame; lets us repaint only the rows whose
+    # styling changed instead of clearing and redrawing everything.
+    last_frame = {'ideas': None, 'selection': -1, 'scroll': -1,
+                  'moving': None, 'num_ideas': -1, 'size': None}
+    # Only render when a keypress actually changed visible state;
+    # unrecognized keys skip the whole render block.
+    dirty = True
+
     while True:
-        stdscr.clear()
         max_y, max_x = stdscr.getmaxyx()
         visible_ideas = (max_y - 2) // 2
         if visible_ideas < 1:
             stdscr.clear()
             stdscr.addstr(0, 0, "Terminal too small! Please enlarge the window.")
             stdscr.refresh()
+            last_frame['size'] = None
             key = stdscr.getch()
             if key == ord('q'):
                 break
             continue
 
         if moving_idea_index is None:
-            ideas = get_ideas(conn, current_order)
+            ideas = fetch_ideas(current_order)
         else:
             ideas = reorder_list
         num_ideas = len(ideas)
@@ -263,80 +403,104 @@ def main(stdscr):
         elif current_selection >= scroll_offset + visible_ideas:
             scroll_offset = current_selection - visible_ideas + 1
 
-        for idx in range(scroll_offset, min(num_ideas, scroll_offset + visible_ideas)):
-            idea = ideas[idx]
-            idea_id, title, pos, created_date, notes, archived = idea
-            # Truncate idea notes to the first 50 characters (append "..." if longer)
-            truncated_notes = (notes[:50] + '...') if len(notes) > 50 else notes
-            text_part = f"{idx + 1}. {title}"
-            notes_part = f" | {truncated_notes}"
-            date_part = f" | {created_date}"
-            status = " | Archived" if archived else ""
-            row = (idx - scroll_offset) * 2
-
-            if archived:
-                idea_text_color = curses.color_pair(6)
-            else:
-                idea_text_color = curses.color_pair(4) | curses.A_BOLD
-
-            # When the idea is selected or being moved, highlight the title,
-            # but draw the date with normal attributes.
-            if moving_idea_index is not None and idx == moving_idea_index:
-                text_style = idea_text_color | curses.A_UNDERLINE
-                date_style = curses.A_NORMAL
-            elif idx == current_selection:
-                text_style = idea_text_color | curses.A_REVERSE
-                date_style = curses.A_NORMAL
-            else:
-                text_style = idea_text_color
-                date_style = curses.color_pair(5)
-
-            try:
-                stdscr.addstr(row, 0, text_part, text_style)
-                stdscr.addstr(row, len(text_part), notes_part)
-                stdscr.addstr(row, len(text_part) + len(notes_part), date_part, date_style)
-                stdscr.addstr(row, len(text_part) + len(notes_part) + len(date_part),
-                              status, curses.color_pair(1) | curses.A_BOLD)
-                stdscr.addstr(row + 1, 0, "-" * (max_x - 1))
-            except curses.error:
-                pass
+        if dirty:
+            # A full repaint is needed whenever anything other than the
+            # highlight changed (different list, scroll, resize); otherwise
+            # only the rows that gained or lost a highlight are redrawn.
+            full_redraw = (ideas is not last_frame['ideas']
+                           or num_ideas != last_frame['num_ideas']
+                           or scroll_offset != last_frame['scroll']
+                           or (max_y, max_x) != last_frame['size'])
+
+            if full_redraw:
+                # erase() only blanks the virtual screen; unlike clear() it
+                # lets curses diff against what is already displayed and emit
+                # just the cells that changed.
+                stdscr.erase()
+                for idx in range(scroll_offset, min(num_ideas, scroll_offset + visible_ideas)):
+                    row = (idx - scroll_offset) * 2
+                    draw_idea_row(stdscr, ideas[idx], idx, row, max_x,
+                                  idx == current_selection,
+                                  idx == moving_idea_index)
 
-        if moving_idea_index is None:
-            instruction = ("Press 'a' to add, 'Del' to remove, space to move, "
-                           "'d' to toggle archived, 'e' to edit, 'o' to change ordering, 'q' to quit. Use up/down to scroll.")
-        else:
-            instruction = "Moving idea. Use arrow keys to reposition. Press space to confirm new order."
-        try:
-            stdscr.addstr(max_y - 2, 0, instruction)
-        except curses.error:
-            pass
+                if moving_idea_index is None:
+                    instruction = ("Press 'a' to add, 'Del' to remove, space to move, "
+                                   "'d' to toggle archived, 'e' to edit, 'o' to change ordering, 'q' to quit. Use up/down to scroll.")
+                else:
+                    instruction = "Moving idea. Use arrow keys to reposition. Press space to confirm new order."
+                try:
+                    stdscr.addstr(max_y - 2, 0, instruction)
+                except curses.error:
+                    pass
+            else:
+                stale = {last_frame['selection'], current_selection}
+                if last_frame['moving'] is not None and moving_idea_index is not None:
+                    # A coalesced multi-step move shifts every row between
+                    # the old and new position, not just the endpoints.
+                    lo = min(last_frame['moving'], moving_idea_index)
+                    hi = max(last_frame['moving'], moving_idea_index)
+                    stale.update(range(lo, hi + 1))
+                stale.discard(None)
+                for idx in stale:
+                    if scroll_offset <= idx < min(num_ideas, scroll_offset + visible_ideas):
+                        row = (idx - scroll_offset) * 2
+                        stdscr.move(row, 0)
+                        stdscr.clrtoeol()
+                        draw_idea_row(stdscr, ideas[idx], idx, row, max_x,
+                                      idx == current_selection,
+                                      idx == moving_idea_index)
+
+            last_frame.update(ideas=ideas, selection=current_selection,
+                              scroll=scroll_offset, moving=moving_idea_index,
+                              num_ideas=num_ideas, size=(max_y, max_x))
+
+            stdscr.noutrefresh()
+            curses.doupdate()
+            dirty = False
 
-        stdscr.refresh()
         key = stdscr.getch()
 
+        if key in (curses.KEY_UP, curses.KEY_DOWN):
+            # Coalesce auto-repeat: drain any queued same-direction arrows
+            # so a held key moves several steps in a single frame instead
+            # of rendering one frame per repeat tick.
+            step = 1
+            stdscr.nodelay(True)
+            while (nxt := stdscr.getch()) == key:
+                step += 1
+            stdscr.nodelay(False)
+            if nxt != -1:
+                curses.ungetch(nxt)
+
         if key == ord('q'):
             break
         elif key == curses.KEY_RESIZE:
+            dirty = True
             continue
         elif key == curses.KEY_UP:
+            dirty = True
             if moving_idea_index is None:
-                current_selection = max(0, current_selection - 1)
+                current_selection = max(0, current_selection - step)
             else:
-                if moving_idea_index > 0:
+                while step > 0 and moving_idea_index > 0:
                     reorder_list[moving_idea_index], reorder_list[moving_idea_index - 1] = \
                         reorder_list[moving_idea_index - 1], reorder_list[moving_idea_index]
                     moving_idea_index -= 1
-                    current_selection = moving_idea_index
+                    step -= 1
+                current_selection = moving_idea_index
         elif key == curses.KEY_DOWN:
+            dirty = True
             if moving_idea_index is None:
-                current_selection = min(num_ideas - 1, current_selection + 1)
+                current_selection = min(num_ideas - 1, current_selection + step)
             else:
-                if moving_idea_index < num_ideas - 1:
+                while step > 0 and moving_idea_index < num_ideas - 1:
                     reorder_list[moving_idea_index], reorder_list[moving_idea_index + 1] = \
                         reorder_list[moving_idea_index + 1], reorder_list[moving_idea_index]
                     moving_idea_index += 1
-                    current_selection = moving_idea_index
+                    step -= 1
+                current_selection = moving_idea_index
         elif key == ord('o') and moving_idea_index is None:
+            dirty = True
             prompt = "Order ideas by (i) ideas or (d) date? "
             stdscr.addstr(curses.LINES - 1, 0, prompt)
             stdscr.clrtoeol()
@@ -349,45 +513,61 @@ def main(stdscr):
                 current_order = 'created_date'
             current_selection = 0
             scroll_offset = 0
+            last_frame['ideas'] = None  # prompt overwrote the screen
         elif key == ord('a') and moving_idea_index is None:
+            dirty = True
             new_idea = new_idea_dialog(stdscr)
+            last_frame['ideas'] = None  # dialog overwrote the screen
             if new_idea is not None:
                 idea_title, idea_notes = new_idea
-                add_idea(conn, idea_title, idea_notes)
-                ideas = get_ideas(conn, current_order)
+                add_idea(cur, idea_title, idea_notes)
+                invalidate_ideas()
+                ideas = fetch_ideas(current_order)
                 current_selection = len(ideas) - 1
                 if current_selection >= scroll_offset + visible_ideas:
                     scroll_offset = current_selection - visible_ideas + 1
         elif key in (curses.KEY_DC, curses.KEY_BACKSPACE, 127) and moving_idea_index is None:
             if num_ideas > 0:
+                dirty = True
                 idea_id = ideas[current_selection][0]
-                delete_idea(conn, idea_id)
-                ideas = get_ideas(conn, current_order)
+                delete_idea(cur, idea_id)
+                invalidate_ideas()
+                ideas = fetch_ideas(current_order)
                 if current_selection >= len(ideas):
                     current_selection = max(0, len(ideas) - 1)
                 scroll_offset = 0
         elif key == ord('d') and moving_idea_index is None:
             if num_ideas > 0:
-                idea = ideas[current_selection]
-                idea_id, _, _, _, _, archived = idea
-                toggle_idea_archived(conn, idea_id, archived)
+                dirty = True
+                toggle_idea_archived(cur, ideas[current_selection][0])
+                invalidate_ideas()
         elif key == ord('e') and moving_idea_index is None:
             if num_ideas > 0:
-                idea = ideas[current_selection]
+                dirty = True
+                # The list view only carries a notes preview; pull the full
+                # notes for this one idea before opening the editor.
+                idea = get_idea_full(cur, ideas[current_selection][0])
                 idea_id, title, pos, created_date, notes, archived = idea
                 edited = edit_idea_dialog(stdscr, title, notes)
+                last_frame['ideas'] = None  # dialog overwrote the screen
                 if edited is not None:
                     new_title, new_notes = edited
-                    update_idea_info(conn, idea_id, new_title, new_notes)
+                    # Skip the write (and the cache flush) when the user
+                    # reviewed the idea but changed nothing.
+                    if new_title != title or new_notes != notes:
+                        update_idea_info(cur, idea_id, new_title, new_notes)
+                        invalidate_ideas()
         elif key == ord(' '):
             if current_order != 'pos':
                 curses.flash()
             else:
+                dirty = True
                 if moving_idea_index is None:
-                    reorder_list = get_ideas(conn, current_order)
+                    reorder_list = list(fetch_ideas(current_order))
                     moving_idea_index = current_selection
                 else:
-                    update_idea_order(conn, reorder_list)
+                    update_idea_order(cur, reorder_list)
+                    invalidate_ideas()
                     current_selection = moving_idea_index
                     moving_idea_index = None
                     reorder_list = None